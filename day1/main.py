@@ -4,7 +4,6 @@ The Tyranny of the Rocket Equation
 https://adventofcode.com/2019/day/1
 """
 
-from functools import cache
 from os import path
 
 INPUT_FILE = "input.txt"
@@ -14,36 +13,29 @@ def read_module_masses(file_path: str) -> list[int]:
     """Read module masses from a file."""
 
     with open(file_path, encoding="utf-8") as file:
-        return [int(line.strip()) for line in file]
-
-
-@cache
-def get_fuel_requirement(mass: int) -> int:
-    """Determine the amount of fuel required for a given mass."""
-
-    if mass <= 0:
-        return 0
-
-    return mass // 3 - 2
+        return list(map(int, file))
 
 
 def get_module_fuel_requirement(module_mass: int) -> int:
     """Determine the amount of fuel required strictly for a module."""
 
-    return get_fuel_requirement(module_mass)
+    if module_mass <= 0:
+        return 0
+
+    return module_mass // 3 - 2
 
 
-@cache
 def get_total_fuel_requirement(mass: int) -> int:
     """Determine the amount of fuel required for a module and its fuel."""
 
-    fuel_requirement_for_current_mass = get_fuel_requirement(mass)
-    if fuel_requirement_for_current_mass <= 0:
-        return 0
-    
-    fuel_requirement_for_fuel = get_total_fuel_requirement(fuel_requirement_for_current_mass)
+    total_fuel_requirement = 0
+    fuel_requirement = mass // 3 - 2
 
-    return fuel_requirement_for_current_mass + fuel_requirement_for_fuel
+    while fuel_requirement > 0:
+        total_fuel_requirement += fuel_requirement
+        fuel_requirement = fuel_requirement // 3 - 2
+
+    return total_fuel_requirement
 
 
 def main() -> None:
@@ -54,11 +46,9 @@ def main() -> None:
 
     module_masses = read_module_masses(file_path)
 
-    module_fuel_requirements = [get_module_fuel_requirement(mass) for mass in module_masses]
-    print(sum(module_fuel_requirements))
-    
-    total_fuel_requirements = [get_total_fuel_requirement(mass) for mass in module_masses]
-    print(sum(total_fuel_requirements))
+    print(sum(map(get_module_fuel_requirement, module_masses)))
+
+    print(sum(map(get_total_fuel_requirement, module_masses)))
 
 
 if __name__ == "__main__":
@@ -4,18 +4,33 @@ Advent of Code 2019, Day 2
 https://adventofcode.com/2019/day/2
 """
 
+from array import array
 from collections.abc import Callable
 from functools import partial
+from operator import add, mul
 from os import path
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 INPUT_FILE = "input.txt"
 TEST_FILE = "test.txt"
+SELF_MODIFYING_TEST_FILE = "test_self_modifying.txt"
 
 TARGET_OUTPUT = 19690720
 TARGET_PARAMETER_RANGE = range(100)
 
-Program = list[int]
+ADD_OPCODE = 1
+MULTIPLY_OPCODE = 2
+INSTRUCTION_SIZE = 4
+
+PROGRAM_TYPECODE = "q"
+
+Program = array
+Operation = Callable[[int, int], int]
+
+OPERATIONS: dict[int, Operation] = {
+    ADD_OPCODE: add,
+    MULTIPLY_OPCODE: mul,
+}
 
 
 class Parameters(NamedTuple):
@@ -25,72 +40,26 @@ class Parameters(NamedTuple):
     verb: int
 
 
-class Operation(NamedTuple):
-    """Represents an operation in the program state."""
-
-    opcode: int
-    size: int
-    execute: Callable[[Program, int], Program]
-
-
-def execute_add_operation(program: Program, instruction_pointer: int) -> Program:
-    """Execute an add operation on the program state."""
-
-    read_address_1 = program[instruction_pointer + 1]
-    read_address_2 = program[instruction_pointer + 2]
-    write_address = program[instruction_pointer + 3]
-
-    value_1 = program[read_address_1]
-    value_2 = program[read_address_2]
-
-    result = value_1 + value_2
-
-    updated_program = program.copy()
-    updated_program[write_address] = result
-
-    return updated_program
-
+class Instruction(NamedTuple):
+    """Represents a decoded instruction and the addresses it operates on."""
 
-def execute_multiply_operation(program: Program, instruction_pointer: int) -> Program:
-    """Execute a multiply operation on the program state."""
-
-    read_address_1 = program[instruction_pointer + 1]
-    read_address_2 = program[instruction_pointer + 2]
-    write_address = program[instruction_pointer + 3]
-
-    value_1 = program[read_address_1]
-    value_2 = program[read_address_2]
-
-    result = value_1 * value_2
-
-    updated_program = program.copy()
-    updated_program[write_address] = result
-
-    return updated_program
-
-
-ADD_OPERATION = Operation(opcode=1, size=4, execute=execute_add_operation)
-MULTIPLY_OPERATION = Operation(opcode=2, size=4, execute=execute_multiply_operation)
-HALT_OPERATION = Operation(opcode=99, size=1, execute=id)
-
-OPERATIONS = {
-    ADD_OPERATION.opcode: ADD_OPERATION,
-    MULTIPLY_OPERATION.opcode: MULTIPLY_OPERATION,
-    HALT_OPERATION.opcode: HALT_OPERATION,
-}
+    operation: Operation
+    read_address_1: int
+    read_address_2: int
+    write_address: int
 
 
 def read_program_state(file_name: str) -> Program:
     """Read the initial state of the program from a file."""
 
     with open(file_name, encoding="utf-8") as file:
-        return [int(value) for value in file.read().split(",")]
+        return array(PROGRAM_TYPECODE, map(int, file.read().split(",")))
 
 
 def set_program_parameters(program: Program, noun: int, verb: int) -> Program:
     """Set the noun and verb values in the program state."""
 
-    configured_program = program.copy()
+    configured_program = array(PROGRAM_TYPECODE, program)
 
     configured_program[1] = noun
     configured_program[2] = verb
@@ -101,20 +70,59 @@ def set_program_parameters(program: Program, noun: int, verb: int) -> Program:
 recreate_1202_program_alarm_state = partial(set_program_parameters, noun=12, verb=2)
 
 
+def decode_program(program: Program, start: int) -> tuple[list[Instruction], int]:
+    """Decode the instructions of a program from a starting address.
+
+    Decoding stops at the first instruction that is not an operation or that
+    runs past the end of memory, and the address just past its opcode is
+    returned as the end of the decoded code.
+    """
+
+    instructions = []
+    pointer = start
+    memory_size = len(program)
+
+    while pointer + INSTRUCTION_SIZE <= memory_size and (
+        operation := OPERATIONS.get(program[pointer])
+    ):
+        read_address_1, read_address_2, write_address = program[
+            pointer + 1 : pointer + INSTRUCTION_SIZE
+        ]
+        instructions.append(
+            Instruction(operation, read_address_1, read_address_2, write_address)
+        )
+        pointer += INSTRUCTION_SIZE
+
+    return instructions, pointer + 1
+
+
 def simulate_program(program: Program) -> Program:
-    """Simulate the program execution, returning the final state."""
+    """Simulate the program execution in place, returning the final state.
+
+    The program is decoded ahead of execution so that each step only applies
+    an operation to its addresses. If the program writes over an instruction
+    that has not run yet, the rest of it is decoded again.
+    """
 
     pointer = 0
 
     while True:
-        operation = OPERATIONS.get(program[pointer], HALT_OPERATION)
-        if operation == HALT_OPERATION:
-            break
+        instructions, code_end = decode_program(program, pointer)
+
+        if not instructions:
+            if program[pointer] in OPERATIONS:
+                raise IndexError(f"Truncated instruction at address {pointer}")
 
-        program = operation.execute(program, pointer)
-        pointer += operation.size
+            return program
 
-    return program
+        for operation, read_address_1, read_address_2, write_address in instructions:
+            program[write_address] = operation(
+                program[read_address_1], program[read_address_2]
+            )
+            pointer += INSTRUCTION_SIZE
+
+            if pointer <= write_address < code_end:
+                break
 
 
 def read_output(program: Program) -> int:
@@ -123,30 +131,93 @@ def read_output(program: Program) -> int:
     return program[0]
 
 
+def compute_output(program: Program, memory: Program, parameters: Parameters) -> int:
+    """Compute the output of the program for the given parameters.
+
+    The program is loaded into the provided memory buffer, which is overwritten.
+    """
+
+    noun, verb = parameters
+    memory[:] = program
+    memory[1] = noun
+    memory[2] = verb
+
+    final_state = simulate_program(memory)
+
+    return read_output(final_state)
+
+
 def parameters_yield_target_output(
     program: Program,
+    memory: Program,
     parameters: Parameters,
     target_output: int,
 ) -> bool:
     """Determine if the given parameters produce the target output."""
 
-    noun, verb = parameters
-    configured_program = set_program_parameters(program, noun, verb)
+    return compute_output(program, memory, parameters) == target_output
 
-    final_state = simulate_program(configured_program)
 
-    output = read_output(final_state)
+def solve_linear_parameters(
+    program: Program,
+    memory: Program,
+    target_output: int,
+) -> Optional[Parameters]:
+    """Solve for the parameters assuming the output is affine in noun and verb.
+
+    The output is modelled as base + noun_weight * noun + verb_weight * verb,
+    with the weights fitted from three simulations. The candidate is confirmed
+    by simulating it, so None is returned if the model does not hold.
+    """
+
+    base = compute_output(program, memory, Parameters(0, 0))
+    noun_weight = compute_output(program, memory, Parameters(1, 0)) - base
+    verb_weight = compute_output(program, memory, Parameters(0, 1)) - base
+
+    for noun in TARGET_PARAMETER_RANGE:
+        remainder = target_output - base - noun_weight * noun
+
+        if verb_weight == 0:
+            if remainder != 0:
+                continue
+            verb = TARGET_PARAMETER_RANGE[0]
+        elif remainder % verb_weight == 0:
+            verb = remainder // verb_weight
+        else:
+            continue
 
-    return output == target_output
+        if verb not in TARGET_PARAMETER_RANGE:
+            continue
+
+        parameters = Parameters(noun, verb)
+        if parameters_yield_target_output(program, memory, parameters, target_output):
+            return parameters
+
+        return None
+
+    return None
 
 
 def find_parameters_for_output(program: Program, target_output: int) -> Parameters:
-    """Find the noun and verb that produce the target output."""
+    """Find the noun and verb that produce the target output.
+
+    The parameters are solved for directly when the program is affine in its
+    inputs, falling back to an exhaustive search otherwise.
+    """
+
+    original_program = array(PROGRAM_TYPECODE, program)
+    memory = array(PROGRAM_TYPECODE, original_program)
+
+    parameters = solve_linear_parameters(original_program, memory, target_output)
+    if parameters is not None:
+        return parameters
 
     for noun in TARGET_PARAMETER_RANGE:
         for verb in TARGET_PARAMETER_RANGE:
             parameters = Parameters(noun, verb)
-            if parameters_yield_target_output(program, parameters, target_output):
+            if parameters_yield_target_output(
+                original_program, memory, parameters, target_output
+            ):
                 return parameters
 
     raise ValueError("No parameters yield the target output.")
@@ -4,8 +4,7 @@ Crossed Wires
 https://adventofcode.com/2019/day/3
 """
 
-import re
-from enum import Enum
+from collections.abc import Iterator
 from os import path
 from typing import NamedTuple
 
@@ -14,7 +13,12 @@ TEST_FILE_1 = "test1.txt"
 TEST_FILE_2 = "test2.txt"
 TEST_FILE_3 = "test3.txt"
 
-SEGMENT_REGEX = re.compile(r"([UDLR])(\d+)")
+DIRECTION_DELTAS = {
+    "U": (0, 1),
+    "D": (0, -1),
+    "L": (-1, 0),
+    "R": (1, 0),
+}
 
 
 class Position(NamedTuple):
@@ -24,25 +28,40 @@ class Position(NamedTuple):
     y: int
 
 
-class Direction(Enum):
-    """Represents a direction in which a wire moves."""
-
-    UP = "U"
-    DOWN = "D"
-    LEFT = "L"
-    RIGHT = "R"
-
-
 class Segment(NamedTuple):
     """Represents a segment of a wire path."""
 
-    direction: Direction
+    direction: str
     length: int
 
 
 Wire = list[Segment]
 
 
+class Span(NamedTuple):
+    """Represents a straight run of a wire between two turns."""
+
+    start: Position
+    end: Position
+    steps: int
+
+
+class Bounds(NamedTuple):
+    """Represents the bounding box of a span of wire."""
+
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+
+
+class Crossing(NamedTuple):
+    """Represents a position where two wires cross."""
+
+    position: Position
+    signal_delay: int
+
+
 def read_wires(file_path: str) -> list[Wire]:
     """Read wire data from a file."""
 
@@ -53,107 +72,128 @@ def read_wires(file_path: str) -> list[Wire]:
 def parse_wire(line: str) -> Wire:
     """Parse a line of wire data into a wire path."""
 
-    return [parse_segment(segment) for segment in line.split(",")]
+    return [parse_segment(segment) for segment in line.strip().split(",")]
 
 
 def parse_segment(segment: str) -> Segment:
     """Parse a segment of a wire path."""
 
-    pattern_match = SEGMENT_REGEX.match(segment)
-    if not pattern_match:
+    direction, length = segment[:1], segment[1:]
+    if direction not in DIRECTION_DELTAS or not length.isdecimal():
         raise ValueError(f"Invalid segment: {segment}")
 
-    direction = Direction(pattern_match.group(1))
-    length = int(pattern_match.group(2))
+    return Segment(direction, int(length))
 
-    return Segment(direction, length)
 
+def get_wire_spans(wire: Wire) -> list[Span]:
+    """Find the straight spans of a wire path along with the steps to reach them."""
 
-def advance_position(position: Position, direction: Direction) -> Position:
-    """Advance a position in a given direction."""
+    spans = []
+    start = Position(0, 0)
+    steps = 0
 
-    x, y = position
+    for direction, length in wire:
+        dx, dy = DIRECTION_DELTAS[direction]
+        end = Position(start.x + dx * length, start.y + dy * length)
 
-    if direction == Direction.UP:
-        return Position(x, y + 1)
-    elif direction == Direction.DOWN:
-        return Position(x, y - 1)
-    elif direction == Direction.LEFT:
-        return Position(x - 1, y)
-    elif direction == Direction.RIGHT:
-        return Position(x + 1, y)
+        spans.append(Span(start, end, steps))
 
-    raise ValueError(f"Invalid direction: {direction}")
+        start = end
+        steps += length
 
+    return spans
 
-def get_distinct_wire_positions(wire: Wire) -> set[Position]:
-    """Find the distinct positions occupied by a wire path."""
 
-    current_position = Position(0, 0)
-    visited_positions = set()
+def get_span_bounds(span: Span) -> Bounds:
+    """Get the bounding box of a span."""
 
-    for direction, length in wire:
-        for _ in range(length):
-            current_position = advance_position(current_position, direction)
-            visited_positions.add(current_position)
+    start, end, _ = span
 
-    return visited_positions
+    return Bounds(
+        min(start.x, end.x),
+        max(start.x, end.x),
+        min(start.y, end.y),
+        max(start.y, end.y),
+    )
 
 
-def find_intersections(wires: list[Wire]) -> set[Position]:
-    """Find the positions where two wires intersect."""
+def find_span_crossings(
+    span1: Span,
+    bounds1: Bounds,
+    span2: Span,
+    bounds2: Bounds,
+) -> Iterator[Crossing]:
+    """Find the positions shared by two spans.
 
-    wire_positions = [get_distinct_wire_positions(wire) for wire in wires]
+    Perpendicular spans share at most one position, while parallel spans may
+    overlap along a run of positions.
+    """
 
-    return set.intersection(*wire_positions)
+    min_x = max(bounds1.min_x, bounds2.min_x)
+    max_x = min(bounds1.max_x, bounds2.max_x)
+    if min_x > max_x:
+        return
 
+    min_y = max(bounds1.min_y, bounds2.min_y)
+    max_y = min(bounds1.max_y, bounds2.max_y)
+    if min_y > max_y:
+        return
 
-def manhattan_distance(position1: Position, position2: Position) -> int:
-    """Calculate the Manhattan distance between two positions."""
+    for x in range(min_x, max_x + 1):
+        for y in range(min_y, max_y + 1):
+            position = Position(x, y)
+            signal_delay = (
+                span1.steps
+                + manhattan_distance(span1.start, position)
+                + span2.steps
+                + manhattan_distance(span2.start, position)
+            )
 
-    return abs(position1.x - position2.x) + abs(position1.y - position2.y)
+            yield Crossing(position, signal_delay)
 
 
-def find_distance_to_closest_intersection(wires: list[Wire]) -> int:
-    """Find the distance to the closest intersection of two wires."""
+def find_crossings(wires: list[Wire]) -> list[Crossing]:
+    """Find the positions where two wires cross.
 
-    intersections = find_intersections(wires)
-    origin = Position(0, 0)
+    The origin is never counted as a crossing, even if both wires return to it.
+    """
 
-    return min(manhattan_distance(origin, position) for position in intersections)
+    if len(wires) != 2:
+        raise ValueError(f"Expected exactly two wires, got {len(wires)}")
 
+    wire1, wire2 = wires
+    origin = Position(0, 0)
 
-def find_minimum_steps_to_wire_positions(wire: Wire) -> dict[Position, int]:
-    """Find the minimum number of steps to reach each position on a wire path."""
+    spans1 = [(span, get_span_bounds(span)) for span in get_wire_spans(wire1)]
+    spans2 = [(span, get_span_bounds(span)) for span in get_wire_spans(wire2)]
 
-    current_position = Position(0, 0)
-    steps_to_positions = {current_position: 0}
-    steps = 0
+    return [
+        crossing
+        for span1, bounds1 in spans1
+        for span2, bounds2 in spans2
+        for crossing in find_span_crossings(span1, bounds1, span2, bounds2)
+        if crossing.position != origin
+    ]
 
-    for direction, length in wire:
-        for _ in range(length):
-            current_position = advance_position(current_position, direction)
-            steps += 1
 
-            if current_position not in steps_to_positions:
-                steps_to_positions[current_position] = steps
+def manhattan_distance(position1: Position, position2: Position) -> int:
+    """Calculate the Manhattan distance between two positions."""
+
+    return abs(position1.x - position2.x) + abs(position1.y - position2.y)
 
-    return steps_to_positions
 
+def find_distance_to_closest_intersection(crossings: list[Crossing]) -> int:
+    """Find the distance to the closest intersection of two wires."""
 
-def find_minimum_signal_delay(wires: list[Wire]) -> int:
-    """Find the minimum signal delay to an intersection of two wires."""
+    origin = Position(0, 0)
 
-    wire_steps = [find_minimum_steps_to_wire_positions(wire) for wire in wires]
-    intersections = find_intersections(wires)
+    return min(manhattan_distance(origin, crossing.position) for crossing in crossings)
 
-    min_signal_delay = float("inf")
 
-    for position in intersections:
-        signal_delays = [wire_steps[position] for wire_steps in wire_steps]
-        min_signal_delay = min(min_signal_delay, sum(signal_delays))
+def find_minimum_signal_delay(crossings: list[Crossing]) -> int:
+    """Find the minimum signal delay to an intersection of two wires."""
 
-    return min_signal_delay
+    return min(crossing.signal_delay for crossing in crossings)
 
 
 def main() -> None:
@@ -165,10 +205,12 @@ def main() -> None:
     wires = read_wires(file_path)
     print(wires)
 
-    distance_to_closest_intersection = find_distance_to_closest_intersection(wires)
+    crossings = find_crossings(wires)
+
+    distance_to_closest_intersection = find_distance_to_closest_intersection(crossings)
     print(distance_to_closest_intersection)
 
-    min_signal_delay = find_minimum_signal_delay(wires)
+    min_signal_delay = find_minimum_signal_delay(crossings)
     print(min_signal_delay)
 
 
@@ -4,94 +4,152 @@ Secure Container
 https://adventofcode.com/2019/day/4
 """
 
-from collections import Counter
 from collections.abc import Callable, Generator
-from itertools import pairwise
-from math import log10
 
 PASSWORD_RANGE = range(359282, 820401)
 
 
-Validator = Callable[[int], bool]
+Digits = tuple[int, int, int, int, int, int]
+MutableDigits = list[int]
+Validator = Callable[[Digits], bool]
 
+PASSWORD_LENGTH = 6
+PASSWORD_MINIMUM = 10 ** (PASSWORD_LENGTH - 1)
+PASSWORD_LIMIT = 10**PASSWORD_LENGTH
 
-def get_password_length(password: int) -> int:
-    """Get the length of a password."""
 
-    return int(log10(password)) + 1
+def contains_repeated_digits(digits: Digits) -> bool:
+    """Check if a password has two or more repeated digits."""
+
+    d0, d1, d2, d3, d4, d5 = digits
+
+    return d0 == d1 or d1 == d2 or d2 == d3 or d3 == d4 or d4 == d5
+
+
+def contains_isolated_pair_of_repeated_digits(digits: Digits) -> bool:
+    """Check if the password contains an isolated pair of repeated digits.
+
+    The repeated digits must not be part of a larger group of repeated digits.
+    """
 
+    run_length = 1
 
-def get_nth_digit(password: int, n: int) -> int:
-    """Get the nth digit of a password."""
+    for index in range(1, len(digits)):
+        if digits[index] == digits[index - 1]:
+            run_length += 1
+            continue
 
-    return password // 10**n % 10
+        if run_length == 2:
+            return True
 
+        run_length = 1
 
-def get_digits_by_significance(password: int) -> Generator[int, None, None]:
+    return run_length == 2
+
+
+def get_digits(password: int) -> MutableDigits:
     """Get the digits of a password starting from the most significant digit."""
 
-    password_length = get_password_length(password)
+    digits = [0] * PASSWORD_LENGTH
 
-    for power in range(password_length - 1, -1, -1):
-        yield get_nth_digit(password, power)
+    for index in range(PASSWORD_LENGTH - 1, -1, -1):
+        password, digits[index] = divmod(password, 10)
 
+    return digits
 
-def all_digits_in_ascending_order(password: int) -> bool:
-    """Check if the digits of a password are in ascending order."""
 
-    return all(
-        left_digit <= right_digit
-        for left_digit, right_digit in pairwise(get_digits_by_significance(password))
-    )
+def get_password(digits: MutableDigits) -> int:
+    """Get the password made up of the given digits."""
 
+    password = 0
 
-def contains_repeated_digits(password: int) -> bool:
-    """Check if a password has two or more repeated digits."""
+    for digit in digits:
+        password = password * 10 + digit
 
-    return any(
-        left_digit == right_digit
-        for left_digit, right_digit in pairwise(get_digits_by_significance(password))
-    )
+    return password
 
 
-def contains_isolated_pair_of_repeated_digits(password: int) -> bool:
-    """Check if the password contains an isolated pair of repeated digits.
+def raise_to_ascending_order(digits: MutableDigits) -> None:
+    """Raise the digits to the smallest ascending sequence not below them.
 
-    The repeated digits must not be part of a larger group of repeated digits.
+    At the first descent, every following digit is replaced by the digit just
+    before it.
     """
 
-    digit_counts = Counter(get_digits_by_significance(password))
+    for index in range(1, PASSWORD_LENGTH):
+        if digits[index] < digits[index - 1]:
+            digits[index:] = [digits[index - 1]] * (PASSWORD_LENGTH - index)
+            return
 
-    return any(count == 2 for count in digit_counts.values())
 
+def advance_ascending_digits(digits: MutableDigits) -> bool:
+    """Advance the digits to the next sequence in ascending order.
 
-def count_valid_passwords(
+    Returns False if the digits are already the largest such sequence.
+    """
+
+    for index in range(PASSWORD_LENGTH - 1, -1, -1):
+        if digits[index] < 9:
+            digits[index:] = [digits[index] + 1] * (PASSWORD_LENGTH - index)
+            return True
+
+    return False
+
+
+def generate_ascending_passwords(
     password_range: range,
+) -> Generator[Digits, None, None]:
+    """Generate the digits of passwords in a range that are in ascending order.
+
+    Starting from the first ascending password in the range, each step skips
+    directly to the next ascending password, so no other integers are visited.
+    Only the part of the range holding six-digit passwords is searched.
+    """
+
+    if password_range.step != 1:
+        raise ValueError(f"Password range must have a step of 1: {password_range}")
+
+    start = max(password_range.start, PASSWORD_MINIMUM)
+    stop = min(password_range.stop, PASSWORD_LIMIT)
+    if start >= stop:
+        return
+
+    digits = get_digits(start)
+    raise_to_ascending_order(digits)
+
+    while get_password(digits) < stop:
+        yield tuple(digits)
+
+        if not advance_ascending_digits(digits):
+            return
+
+
+def count_valid_passwords(
+    candidates: list[Digits],
     criteria: list[Validator],
 ) -> int:
-    """Count the number of valid passwords within a password range."""
+    """Count the number of candidate passwords that meet every criterion."""
 
-    return sum(
-        all(criteria(password) for criteria in criteria) for password in password_range
-    )
+    return sum(all(criteria(digits) for criteria in criteria) for digits in candidates)
 
 
 def main() -> None:
     """Process the range of possible passwords."""
 
+    candidates = list(generate_ascending_passwords(PASSWORD_RANGE))
+
     criteria = [
-        all_digits_in_ascending_order,
         contains_repeated_digits,
     ]
 
     lenient_valid_password_count = count_valid_passwords(
-        PASSWORD_RANGE,
+        candidates,
         criteria,
     )
 
     criteria.append(contains_isolated_pair_of_repeated_digits)
     strict_valid_password_count = count_valid_passwords(
-        PASSWORD_RANGE,
+        candidates,
         criteria,
     )
 
@@ -4,7 +4,10 @@ Universal Orbit Map
 https://adventofcode.com/2019/day/6
 """
 
-from dataclasses import dataclass
+from array import array
+from collections import deque
+from functools import cached_property
+from itertools import accumulate
 from os import path
 from pprint import pprint
 from typing import NamedTuple, Optional
@@ -12,6 +15,9 @@ from typing import NamedTuple, Optional
 INPUT_FILE = "input.txt"
 TEST_FILE = "test.txt"
 
+NO_PARENT = -1
+CENTER_OF_MASS = "COM"
+
 
 class Orbit(NamedTuple):
     """Represents an orbital relationship between two objects."""
@@ -20,69 +26,87 @@ class Orbit(NamedTuple):
     child: str
 
 
-@dataclass
-class CelestialObject:
-    """A celestial object in the universe."""
+class OrbitMap:
+    """A map of celestial objects and their direct orbits.
 
-    def __init__(self, name: str) -> None:
-        """Create a celestial object with the given name and parent."""
+    Each object is identified by an integer ID, which indexes parallel arrays
+    of its parent and its range of children.
+    """
 
-        self.name = name
-        self.parent: Optional[CelestialObject] = None
-        self.children: list[CelestialObject] = []
+    def __init__(self, orbits: list[Orbit]) -> None:
+        """Create an orbit map from the given orbital relationships."""
 
-    def __eq__(self, other: object) -> bool:
-        """Check if two celestial objects are equal by their names."""
+        self.object_ids: dict[str, int] = {}
+        self.names: list[str] = []
 
-        if not isinstance(other, CelestialObject):
-            return NotImplemented
+        for parent_name, child_name in orbits:
+            self._add_object(parent_name)
+            self._add_object(child_name)
 
-        return self.name == other.name
+        self.parent_ids = array("i", [NO_PARENT]) * len(self.names)
+        for parent_name, child_name in orbits:
+            self.parent_ids[self.object_ids[child_name]] = self.object_ids[parent_name]
 
-    def __hash__(self) -> int:
-        """Hash the celestial object by its name."""
+        child_counts = [0] * len(self.names)
+        for parent_id in self.parent_ids:
+            if parent_id != NO_PARENT:
+                child_counts[parent_id] += 1
 
-        return hash(self.name)
+        self.child_offsets = array("i", accumulate(child_counts, initial=0))
+        self.child_ids = array("i", [0]) * self.child_offsets[-1]
 
-    def __repr__(self) -> str:
-        """Return a string representation of the object."""
+        next_child_slots = list(self.child_offsets[:-1])
+        for child_id, parent_id in enumerate(self.parent_ids):
+            if parent_id != NO_PARENT:
+                self.child_ids[next_child_slots[parent_id]] = child_id
+                next_child_slots[parent_id] += 1
 
-        return f"CelestialObject({self.name})"
+    def _add_object(self, name: str) -> int:
+        """Get the ID of a celestial object, assigning a new one if necessary."""
 
-    def add_orbital_child(self, child: "CelestialObject") -> None:
-        """Add a child object to this object's orbit."""
+        object_id = self.object_ids.get(name)
+        if object_id is None:
+            object_id = len(self.names)
+            self.object_ids[name] = object_id
+            self.names.append(name)
 
-        self.children.append(child)
-        child.parent = self
+        return object_id
 
+    def __getitem__(self, key: str) -> int:
+        """Get the ID of a celestial object by its name."""
 
-class OrbitMap:
-    """A map of celestial objects and their direct orbits."""
+        return self.object_ids[key]
 
-    def __init__(self, orbits: list[Orbit]) -> None:
-        """Create an orbit map from the given orbital relationships."""
+    def get_children(self, object_id: int) -> array:
+        """Get the IDs of the objects directly orbiting an object."""
 
-        self.celestial_objects: dict[str, CelestialObject] = {}
-        for orbit in orbits:
-            self.add_orbit(orbit)
+        start = self.child_offsets[object_id]
+        end = self.child_offsets[object_id + 1]
 
-    def add_orbit(self, orbit: Orbit) -> None:
-        """Add an orbital relationship to the map."""
+        return self.child_ids[start:end]
 
-        parent_name, child_name = orbit
+    @cached_property
+    def depths(self) -> array:
+        """The number of direct and indirect orbits of each object by ID.
 
-        parent = self.celestial_objects.get(parent_name, CelestialObject(parent_name))
-        child = self.celestial_objects.get(child_name, CelestialObject(child_name))
+        Depths are measured from the universal Center of Mass, and objects that
+        do not orbit it are left at zero. Each depth is derived from its parent's
+        depth, and the result is kept so that later queries do not need to walk
+        the map again.
+        """
 
-        parent.add_orbital_child(child)
+        depths = array("i", [0]) * len(self.names)
+        queue = deque([self[CENTER_OF_MASS]])
 
-        self.celestial_objects[parent_name] = parent
-        self.celestial_objects[child_name] = child
+        while queue:
+            object_id = queue.popleft()
+            children_depth = depths[object_id] + 1
 
-    def __getitem__(self, key: str) -> CelestialObject:
-        """Get a celestial object by its name."""
+            for child_id in self.get_children(object_id):
+                depths[child_id] = children_depth
+                queue.append(child_id)
 
-        return self.celestial_objects[key]
+        return depths
 
 
 def read_orbits(file_path: str) -> list[Orbit]:
@@ -99,20 +123,10 @@ def parse_orbit(line: str) -> Orbit:
     return Orbit(parent, child)
 
 
-def get_orbit_count_checksum(celestial_object: CelestialObject) -> int:
-    """Calculate the total orbit count checksum for a given celestial object."""
-
-    def count_orbits(celestial_object: CelestialObject, depth: int) -> int:
-        """Count the number of direct and indirect orbits for an object."""
+def get_orbit_count_checksum(orbit_map: OrbitMap) -> int:
+    """Calculate the total orbit count checksum for an orbit map."""
 
-        orbit_children = celestial_object.children
-        children_depth = depth + 1
-
-        return depth + sum(
-            count_orbits(child, children_depth) for child in orbit_children
-        )
-
-    return count_orbits(celestial_object, 0)
+    return sum(orbit_map.depths)
 
 
 # The number of transfers required would be the sum of the distances from YOU
@@ -120,58 +134,43 @@ def get_orbit_count_checksum(celestial_object: CelestialObject) -> int:
 # we can identify all the orbital parents for each object and then find the
 # first common parent between them.
 
-# CONSIDER: An alternative structure might be warrented for this problem. The
-# first part of the problem works best when the map associates parents with
-# their children. However, the second works best when the map associates
-# children with their parents. Ideally, we should be able to perform both
-# traversals efficiently. One way we could do this is with a combination of
-# a doubly-linked list and a hash map. The linked list would represent the
-# direct orbits while the hash map would allow us to quickly look up
-# particular objects in the map as a starting point.
 
-
-def get_orbital_parents(celestial_object: CelestialObject) -> list[str]:
+def get_orbital_parents(orbit_map: OrbitMap, object_id: int) -> list[int]:
     """Get the orbital parents in order for a given celestial object."""
 
-    current_object = celestial_object
+    parent_ids = orbit_map.parent_ids
     parents = []
 
-    while current_object:
-        current_object = current_object.parent
-        if current_object:
-            parents.append(current_object)
+    current_id = parent_ids[object_id]
+    while current_id != NO_PARENT:
+        parents.append(current_id)
+        current_id = parent_ids[current_id]
 
     return parents
 
 
-def find_first_common_parent(object1: CelestialObject, object2: CelestialObject) -> str:
+def find_first_common_parent(
+    orbit_map: OrbitMap,
+    object1: int,
+    object2: int,
+) -> Optional[int]:
     """Find the first common orbital parent between two objects."""
 
-    object1_parents = get_orbital_parents(object1)
-    object2_parents = get_orbital_parents(object2)
-
-    print(object1_parents)
-    print(object2_parents)
+    object2_parents = set(get_orbital_parents(orbit_map, object2))
 
-    for parent in object1_parents:
+    for parent in get_orbital_parents(orbit_map, object1):
         if parent in object2_parents:
             return parent
 
+    return None
 
-def get_transfer_count(origin: CelestialObject, target: CelestialObject) -> int:
-    """Get the distance from a child to a parent in the orbit map."""
-
-    transfer_count = 0
-    current_object = origin.parent
 
-    while current_object:
-        if current_object == target:
-            break
+def get_transfer_count(orbit_map: OrbitMap, origin: int, target: int) -> int:
+    """Get the distance from a child to a parent in the orbit map."""
 
-        current_object = current_object.parent
-        transfer_count += 1
+    depths = orbit_map.depths
 
-    return transfer_count
+    return depths[origin] - depths[target] - 1
 
 
 def count_transfers_to_santas_orbital_path(orbit_map: OrbitMap) -> int:
@@ -180,13 +179,17 @@ def count_transfers_to_santas_orbital_path(orbit_map: OrbitMap) -> int:
     you_object = orbit_map["YOU"]
     santa_object = orbit_map["SAN"]
 
-    common_parent = find_first_common_parent(you_object, santa_object)
+    common_parent = find_first_common_parent(orbit_map, you_object, santa_object)
+    if common_parent is None:
+        raise ValueError("YOU and SAN do not share an orbital parent.")
 
     distance_from_parent_to_you = get_transfer_count(
+        orbit_map,
         you_object,
         common_parent,
     )
     distance_from_parent_to_santa = get_transfer_count(
+        orbit_map,
         santa_object,
         common_parent,
     )
@@ -206,7 +209,7 @@ def main() -> None:
     orbit_map = OrbitMap(orbits)
     pprint(orbit_map)
 
-    checksum = get_orbit_count_checksum(orbit_map["COM"])
+    checksum = get_orbit_count_checksum(orbit_map)
     print(f"Total orbit count checksum: {checksum}")
 
     min_transfers = count_transfers_to_santas_orbital_path(orbit_map)